@@ -1,21 +1,53 @@
 #!/usr/bin/env python3
 import argparse
 import csv
+import io
 import json
 import math
+import os
 import re
 from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
 from pathlib import Path
 from statistics import mean, median
 
+try:
+    import orjson  # optional, faster JSON parsing/serialisation
+except ImportError:
+    orjson = None
+
+try:
+    import pyarrow as pa  # optional, only needed for --format parquet
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = pq = None
+
 SUPPORTED_EXTS = {".txt", ".log", ".md", ".csv", ".json"}
 
-BASIC_STOPWORDS = {
+BASIC_STOPWORDS = frozenset({
     "the","a","an","and","or","but","if","then","else","when","at","by","for","in",
     "of","on","to","with","is","it","as","that","this","these","those","are","be",
     "was","were","from","so","we","you","he","she","they","them","his","her","our",
     "your","their","i","me","my","mine","us","will","not","no","yes"
-}
+})
+
+def iter_supported_files(folder, recursive=False):
+    # one os.scandir pass per folder; DirEntry caches the file type, so no extra stat per entry
+    subdirs = []
+    try:
+        with os.scandir(folder) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+                elif os.path.splitext(entry.name)[1].lower() in SUPPORTED_EXTS and entry.is_file():
+                    yield Path(entry.path)
+    except OSError as e:
+        print(f"[WARN] Skipping unreadable folder: {folder} ({e.strerror or e})")
+        return
+    if recursive:
+        for sub in subdirs:
+            yield from iter_supported_files(sub, recursive=True)
 
 def discover_files(inputs, recursive=False):
     files = []
@@ -25,44 +57,64 @@ def discover_files(inputs, recursive=False):
             if p.suffix.lower() in SUPPORTED_EXTS:
                 files.append(p)
         elif p.is_dir():
-            if recursive:
-                for ext in SUPPORTED_EXTS:
-                    files.extend(p.rglob(f"*{ext}"))
-            else:
-                for ext in SUPPORTED_EXTS:
-                    files.extend(p.glob(f"*{ext}"))
+            files.extend(iter_supported_files(p, recursive=recursive))
         else:
             print(f"[WARN] Skipping non-existent path: {p}")
     # De-duplicate while preserving order
     seen = set()
     unique = []
     for f in files:
-        if f.resolve() not in seen:
-            seen.add(f.resolve())
+        key = f.resolve()
+        if key not in seen:
+            seen.add(key)
             unique.append(f)
     return unique
 
 # ---------- TEXT ----------
-WORD_RE = re.compile(r"\b[\w']+\b", re.UNICODE)
+WORD_RE = re.compile(r"\b[\w']+\b")
+# same pattern with ASCII-only \w and \b; gives identical matches on ASCII text and runs faster
+WORD_RE_ASCII = re.compile(r"\b[\w']+\b", re.ASCII)
 
 def read_text(path: Path) -> str:
     return path.read_text(encoding="utf-8", errors="ignore")
 
-def analyze_text(content: str, top_n: int = 10, use_stopwords: bool = False):
-    lines = content.splitlines()
-    chars = len(content)
-    words = [w.lower() for w in WORD_RE.findall(content)]
+# text files larger than this are analyzed in chunks instead of being read whole
+LARGE_TEXT_BYTES = 16 * 1024 * 1024
+TEXT_CHUNK_CHARS = 1024 * 1024
+
+def line_stats(content: str):
+    # str.count and split + map(len) stay in C; the line list is transient and
+    # bounded by LARGE_TEXT_BYTES, since bigger files are analyzed in chunks
+    line_count = content.count("\n")
+    if content and not content.endswith("\n"):
+        line_count += 1
+    longest_line_len = max(map(len, content.split("\n")))
+    return line_count, longest_line_len
+
+def count_words(content: str, counts: Counter, use_stopwords: bool = False):
+    if content.isascii():
+        # lowercasing can't change ASCII word boundaries, so do it in one C-level call
+        words = WORD_RE_ASCII.findall(content.lower())
+    else:
+        # non-ASCII lowercasing can add non-word characters (e.g. "İ" -> "i\u0307"),
+        # so lowercase each token after matching
+        words = map(str.lower, WORD_RE.findall(content))
     if use_stopwords:
-        words = [w for w in words if w not in BASIC_STOPWORDS]
-    word_count = len(words)
-    unique_words = len(set(words))
-    avg_word_len = (sum(len(w) for w in words) / word_count) if word_count else 0.0
-    longest_line_len = max((len(line) for line in lines), default=0)
-    freqs = Counter(words).most_common(top_n)
+        counts.update(w for w in words if w not in BASIC_STOPWORDS)
+    else:
+        counts.update(words)
+
+def text_summary(chars, line_count, longest_line_len, counts: Counter, top_n: int):
+    # derive the totals from the counter so no filtered list or set is built
+    word_count = sum(counts.values())
+    unique_words = len(counts)
+    total_len = sum(len(w) * c for w, c in counts.items())
+    avg_word_len = (total_len / word_count) if word_count else 0.0
+    freqs = counts.most_common(top_n)
 
     return {
         "type": "text",
-        "lines": len(lines),
+        "lines": line_count,
         "characters": chars,
         "words": word_count,
         "unique_words": unique_words,
@@ -71,75 +123,215 @@ def analyze_text(content: str, top_n: int = 10, use_stopwords: bool = False):
         "top_words": [{"word": w, "count": c} for w, c in freqs],
     }
 
+def analyze_text(content: str, top_n: int = 10, use_stopwords: bool = False):
+    line_count, longest_line_len = line_stats(content)
+    counts = Counter()
+    count_words(content, counts, use_stopwords)
+    return text_summary(len(content), line_count, longest_line_len, counts, top_n)
+
+def analyze_text_file(path: Path, top_n: int = 10, use_stopwords: bool = False):
+    # same result as analyze_text(read_text(path)), but only one chunk of whole
+    # lines is held in memory at a time; words never span a newline
+    chars = line_count = longest_line_len = 0
+    counts = Counter()
+    with path.open("r", encoding="utf-8", errors="ignore") as f:
+        while True:
+            chunk = "".join(f.readlines(TEXT_CHUNK_CHARS))
+            if not chunk:
+                break
+            chars += len(chunk)
+            n, longest = line_stats(chunk)
+            line_count += n
+            longest_line_len = max(longest_line_len, longest)
+            count_words(chunk, counts, use_stopwords)
+    return text_summary(chars, line_count, longest_line_len, counts, top_n)
+
 # ---------- CSV ----------
+# characters a float() literal can start with (besides non-ASCII digits)
+NUMBER_START = frozenset("0123456789+-.iInN")
+
 def try_parse_float(x):
-    try:
-        if x is None:
+    if type(x) is str:
+        s = x.strip()
+    elif x is None or isinstance(x, bool):
+        return None
+    elif isinstance(x, (int, float)):
+        try:
+            return float(x)
+        except OverflowError:
             return None
+    else:
         s = str(x).strip()
-        if not s:
-            return None
+    if not s:
+        return None
+    # rejecting text that cannot start a number avoids raising (and catching)
+    # ValueError for most categorical cells
+    c = s[0]
+    if c not in NUMBER_START and not c.isdigit():
+        return None
+    try:
         return float(s)
-    except Exception:
+    except ValueError:
         return None
 
+# numeric columns keep their exact values only up to this many; past it the
+# mean is a running (Welford) mean and the median a P-square estimate
+EXACT_STATS_LIMIT = 10_000
+
+class _P2Median:
+    # P-square streaming median (Jain & Chlamtac, 1985): five markers, O(1) memory
+    def __init__(self, values):
+        # seeded from the exact values collected so far (always >= 5 of them)
+        first = sorted(values[:5])
+        self.q = first
+        self.pos = [0, 1, 2, 3, 4]
+        self.want = [0.0, 1.0, 2.0, 3.0, 4.0]
+        self.step = [0.0, 0.25, 0.5, 0.75, 1.0]
+        for x in values[5:]:
+            self.add(x)
+
+    def add(self, x):
+        q, pos, want = self.q, self.pos, self.want
+        if x < q[0]:
+            q[0] = x
+            k = 0
+        elif x >= q[4]:
+            q[4] = x
+            k = 3
+        else:
+            k = 0
+            while x >= q[k + 1]:
+                k += 1
+        for i in range(k + 1, 5):
+            pos[i] += 1
+        for i in range(5):
+            want[i] += self.step[i]
+        for i in (1, 2, 3):
+            d = want[i] - pos[i]
+            if (d >= 1 and pos[i + 1] - pos[i] > 1) or (d <= -1 and pos[i - 1] - pos[i] < -1):
+                d = 1 if d > 0 else -1
+                # parabolic prediction, falling back to linear if it leaves the bracket
+                qp = q[i] + d / (pos[i + 1] - pos[i - 1]) * (
+                    (pos[i] - pos[i - 1] + d) * (q[i + 1] - q[i]) / (pos[i + 1] - pos[i])
+                    + (pos[i + 1] - pos[i] - d) * (q[i] - q[i - 1]) / (pos[i] - pos[i - 1])
+                )
+                if not q[i - 1] < qp < q[i + 1]:
+                    qp = q[i] + d * (q[i + d] - q[i]) / (pos[i + d] - pos[i])
+                q[i] = qp
+                pos[i] += d
+
+    def value(self):
+        return self.q[2]
+
+class _NumState:
+    # running stats for one numeric column
+    def __init__(self):
+        self.n = 0
+        self.min = math.inf
+        self.max = -math.inf
+        self.mean = 0.0
+        self.values = []  # exact values, dropped once n reaches EXACT_STATS_LIMIT
+        self.median = None
+
+    def add(self, x):
+        self.n += 1
+        if x < self.min:
+            self.min = x
+        if x > self.max:
+            self.max = x
+        self.mean += (x - self.mean) / self.n
+        if self.values is not None:
+            self.values.append(x)
+            if self.n >= EXACT_STATS_LIMIT:
+                self.median = _P2Median(self.values)
+                self.values = None
+        else:
+            self.median.add(x)
+
+    def summary(self):
+        if self.values is not None:
+            # small column: exact results, same as statistics on the full list
+            return self.min, self.max, mean(self.values), median(self.values)
+        return self.min, self.max, self.mean, self.median.value()
+
+# shared by the CSV and JSON-table analyzers; each col_* sequence is aligned with headers
+def summarize_columns(headers, col_missing, col_attempts, col_numeric_hits,
+                      col_values_numeric, col_values_categorical):
+    # type every column in one pass up front:
+    # numeric if >= 80% of non-missing values are numeric
+    is_numeric = [
+        attempts > 0 and numeric_hits / attempts >= 0.8
+        for attempts, numeric_hits in zip(col_attempts, col_numeric_hits)
+    ]
+
+    column_summaries = []
+    for i, h in enumerate(headers):
+        state = col_values_numeric[i]
+        if is_numeric[i] and state.n:
+            lo, hi, avg, mid = state.summary()
+            col_summary = {
+                "name": h,
+                "type": "numeric",
+                "missing": col_missing[i],
+                "count": state.n,
+                "min": lo,
+                "max": hi,
+                "mean": round(avg, 4),
+                "median": round(mid, 4),
+            }
+        else:
+            top = col_values_categorical[i].most_common(5)
+            col_summary = {
+                "name": h,
+                "type": "categorical",
+                "missing": col_missing[i],
+                "count": col_attempts[i],
+                "top_values": [{"value": v, "count": c} for v, c in top],
+            }
+        column_summaries.append(col_summary)
+    return column_summaries
+
 def analyze_csv(path: Path):
     with path.open("r", encoding="utf-8", errors="ignore", newline="") as f:
-        reader = csv.DictReader(f)
-        headers = reader.fieldnames or []
+        # plain reader + positional indexing: no dict is built per row
+        reader = csv.reader(f)
+        headers = next(reader, [])
+        n = len(headers)
         row_count = 0
 
-        col_missing = defaultdict(int)
-        col_values_numeric = defaultdict(list)  # floats
-        col_values_categorical = defaultdict(list)  # strings (raw)
-        col_attempts = defaultdict(int)
-        col_numeric_hits = defaultdict(int)
+        col_missing = [0] * n
+        col_values_numeric = [_NumState() for _ in range(n)]
+        col_values_categorical = [Counter() for _ in range(n)]  # string -> occurrences
+        col_attempts = [0] * n
+        col_numeric_hits = [0] * n
 
         for row in reader:
+            if not row:
+                continue  # blank line
             row_count += 1
-            for h in headers:
-                val = row.get(h)
-                if val is None or str(val).strip() == "":
-                    col_missing[h] += 1
+            if len(row) > n:
+                row = row[:n]
+            for i, val in enumerate(row):
+                # strip each cell once and reuse it
+                s = val.strip()
+                if not s:
+                    col_missing[i] += 1
                     continue
-                col_attempts[h] += 1
-                num = try_parse_float(val)
+                col_attempts[i] += 1
+                num = try_parse_float(s)
                 if num is not None and math.isfinite(num):
-                    col_numeric_hits[h] += 1
-                    col_values_numeric[h].append(num)
+                    col_numeric_hits[i] += 1
+                    col_values_numeric[i].add(num)
                 else:
-                    col_values_categorical[h].append(str(val).strip())
+                    col_values_categorical[i][s] += 1
+            # short rows: the trailing columns are missing
+            for i in range(len(row), n):
+                col_missing[i] += 1
 
-        column_summaries = []
-        for h in headers:
-            attempts = col_attempts[h]
-            numeric_hits = col_numeric_hits[h]
-            # consider numeric if >= 80% of non-missing values are numeric
-            is_numeric = (attempts > 0 and numeric_hits / attempts >= 0.8)
-
-            if is_numeric and col_values_numeric[h]:
-                vals = col_values_numeric[h]
-                col_summary = {
-                    "name": h,
-                    "type": "numeric",
-                    "missing": col_missing[h],
-                    "count": len(vals),
-                    "min": min(vals),
-                    "max": max(vals),
-                    "mean": round(mean(vals), 4),
-                    "median": round(median(vals), 4),
-                }
-            else:
-                vals = col_values_categorical[h]
-                top = Counter(vals).most_common(5)
-                col_summary = {
-                    "name": h,
-                    "type": "categorical",
-                    "missing": col_missing[h],
-                    "count": attempts,
-                    "top_values": [{"value": v, "count": c} for v, c in top],
-                }
-            column_summaries.append(col_summary)
+        column_summaries = summarize_columns(
+            headers, col_missing, col_attempts, col_numeric_hits,
+            col_values_numeric, col_values_categorical,
+        )
 
         return {
             "type": "csv",
@@ -150,72 +342,84 @@ def analyze_csv(path: Path):
         }
 
 # ---------- JSON ----------
+# orjson is stricter than the json module, so anything it rejects is retried with json
+# (NaN/Infinity literals, non-str dict keys). It also silently turns integers outside
+# the 64-bit range into floats, so text with any run of 19+ digits goes straight to
+# json, which keeps them exact. Output written by orjson can still differ in float
+# formatting (1e308 vs 1e+308) and writes NaN as null.
+LONG_DIGITS_RE = re.compile(r"\d{19,}")
+
+def json_loads(text):
+    if orjson is not None and not LONG_DIGITS_RE.search(text):
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(text)
+
+def json_dumps(obj, indent: bool = True) -> bytes:
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else None)
+        except orjson.JSONEncodeError:
+            pass
+    if indent:
+        return json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
 def analyze_json(path: Path):
-    with path.open("r", encoding="utf-8", errors="ignore") as f:
-        data = json.load(f)
+    data = json_loads(read_text(path))
 
     # list of dicts => treat like a table
     if isinstance(data, list) and (len(data) == 0 or isinstance(data[0], dict)):
-        # build rows like CSV
-        headers = set()
-        for item in data:
-            if isinstance(item, dict):
-                headers.update(item.keys())
-        headers = list(headers)
         # simulate CSV-like analysis
         row_count = len(data)
+        header_set = set()
+        dict_rows = 0
 
+        col_present = defaultdict(int)
         col_missing = defaultdict(int)
-        col_values_numeric = defaultdict(list)
-        col_values_categorical = defaultdict(list)
+        col_values_numeric = defaultdict(_NumState)
+        col_values_categorical = defaultdict(Counter)
         col_attempts = defaultdict(int)
         col_numeric_hits = defaultdict(int)
 
         for item in data:
             if not isinstance(item, dict):
                 continue
-            for h in headers:
-                val = item.get(h)
-                if val is None or str(val).strip() == "":
-                    col_missing[h] += 1
+            dict_rows += 1
+            header_set.update(item.keys())
+            # visit only the keys this record has; absent keys are counted below
+            for k, val in item.items():
+                col_present[k] += 1
+                if val is None:
+                    col_missing[k] += 1
+                    continue
+                if type(val) is str:
+                    val = val.strip()
+                    if not val:
+                        col_missing[k] += 1
+                        continue
+                col_attempts[k] += 1
+                num = try_parse_float(val)
+                if num is not None and math.isfinite(num):
+                    col_numeric_hits[k] += 1
+                    col_values_numeric[k].add(num)
                 else:
-                    col_attempts[h] += 1
-                    num = try_parse_float(val)
-                    if num is not None and math.isfinite(num):
-                        col_numeric_hits[h] += 1
-                        col_values_numeric[h].append(num)
-                    else:
-                        col_values_categorical[h].append(str(val).strip())
-
-        column_summaries = []
+                    col_values_categorical[k][val if type(val) is str else str(val)] += 1
+
+        headers = list(header_set)
         for h in headers:
-            attempts = col_attempts[h]
-            numeric_hits = col_numeric_hits[h]
-            is_numeric = (attempts > 0 and numeric_hits / attempts >= 0.8)
-
-            if is_numeric and col_values_numeric[h]:
-                vals = col_values_numeric[h]
-                col_summary = {
-                    "name": h,
-                    "type": "numeric",
-                    "missing": col_missing[h],
-                    "count": len(vals),
-                    "min": min(vals),
-                    "max": max(vals),
-                    "mean": round(mean(vals), 4),
-                    "median": round(median(vals), 4),
-                }
-            else:
-                vals = col_values_categorical[h]
-                top = Counter(vals).most_common(5)
-                col_summary = {
-                    "name": h,
-                    "type": "categorical",
-                    "missing": col_missing[h],
-                    "count": attempts,
-                    "top_values": [{"value": v, "count": c} for v, c in top],
-                }
-            column_summaries.append(col_summary)
+            col_missing[h] += dict_rows - col_present[h]
+
+        column_summaries = summarize_columns(
+            headers,
+            [col_missing[h] for h in headers],
+            [col_attempts[h] for h in headers],
+            [col_numeric_hits[h] for h in headers],
+            [col_values_numeric[h] for h in headers],
+            [col_values_categorical[h] for h in headers],
+        )
 
         return {
             "type": "json_table",
@@ -252,86 +456,98 @@ def analyze_json(path: Path):
 
 # ---------- REPORTING ----------
 def to_markdown(path: Path, analysis: dict, top_n: int):
-    title = f"# File Report: {path.name}\n\n"
-    base = f"- **Location**: `{path.resolve()}`\n- **Type**: `{analysis.get('type')}`\n\n"
-
-    if analysis["type"] == "text":
-        lines = [
-            "## Summary\n",
-            f"- Lines: **{analysis['lines']}**",
-            f"- Characters: **{analysis['characters']}**",
-            f"- Words: **{analysis['words']}**",
-            f"- Unique Words: **{analysis['unique_words']}**",
-            f"- Avg Word Length: **{analysis['avg_word_length']}**",
-            f"- Longest Line Length: **{analysis['longest_line_length']}**",
-            "\n## Top Words\n",
-            "| Rank | Word | Count |",
-            "|---:|---|---:|",
-        ]
+    # written line by line into one buffer instead of building and joining lists
+    buf = io.StringIO()
+    w = buf.write
+
+    def line(text=""):
+        w(text)
+        w("\n")
+
+    w(f"# File Report: {path.name}\n\n")
+    w(f"- **Location**: `{path.resolve()}`\n- **Type**: `{analysis.get('type')}`\n\n")
+    kind = analysis["type"]
+
+    if kind == "text":
+        line("## Summary\n")
+        line(f"- Lines: **{analysis['lines']}**")
+        line(f"- Characters: **{analysis['characters']}**")
+        line(f"- Words: **{analysis['words']}**")
+        line(f"- Unique Words: **{analysis['unique_words']}**")
+        line(f"- Avg Word Length: **{analysis['avg_word_length']}**")
+        line(f"- Longest Line Length: **{analysis['longest_line_length']}**")
+        line("\n## Top Words\n")
+        line("| Rank | Word | Count |")
+        line("|---:|---|---:|")
         for i, item in enumerate(analysis["top_words"], start=1):
-            lines.append(f"| {i} | {item['word']} | {item['count']} |")
-        return title + base + "\n".join(lines) + "\n"
-
-    if analysis["type"] in ("csv", "json_table"):
-        lines = [
-            "## Summary\n",
-            f"- Rows: **{analysis['rows']}**",
-            f"- Columns: **{analysis['columns']}**",
-            f"- Headers: `{', '.join(analysis['headers'])}`",
-            "\n## Column Details\n",
-        ]
+            line(f"| {i} | {item['word']} | {item['count']} |")
+        return buf.getvalue()
+
+    if kind in ("csv", "json_table"):
+        line("## Summary\n")
+        line(f"- Rows: **{analysis['rows']}**")
+        line(f"- Columns: **{analysis['columns']}**")
+        line(f"- Headers: `{', '.join(analysis['headers'])}`")
+        # the table section has never ended with a trailing newline, so from here
+        # each line is written *after* a separator rather than before one
+        w("\n## Column Details\n")
+
+        def then(text=""):
+            w("\n")
+            w(text)
+
         for col in analysis["columns_detail"]:
+            name = col["name"]
+            missing = col["missing"]
+            count = col["count"]
             if col["type"] == "numeric":
-                lines += [
-                    f"### {col['name']} *(numeric)*",
-                    f"- Missing: **{col['missing']}**",
-                    f"- Count: **{col['count']}**",
-                    f"- Min: **{col['min']}** | Max: **{col['max']}**",
-                    f"- Mean: **{col['mean']}** | Median: **{col['median']}**",
-                    ""
-                ]
+                then(f"### {name} *(numeric)*")
+                then(f"- Missing: **{missing}**")
+                then(f"- Count: **{count}**")
+                then(f"- Min: **{col['min']}** | Max: **{col['max']}**")
+                then(f"- Mean: **{col['mean']}** | Median: **{col['median']}**")
+                then()
             else:
-                lines += [
-                    f"### {col['name']} *(categorical)*",
-                    f"- Missing: **{col['missing']}**",
-                    f"- Observed: **{col['count']}**",
-                    "",
-                    "| Rank | Value | Count |",
-                    "|---:|---|---:|",
-                ]
+                then(f"### {name} *(categorical)*")
+                then(f"- Missing: **{missing}**")
+                then(f"- Observed: **{count}**")
+                then()
+                then("| Rank | Value | Count |")
+                then("|---:|---|---:|")
                 for i, item in enumerate(col.get("top_values", []), start=1):
-                    lines.append(f"| {i} | {item['value']} | {item['count']} |")
-                lines.append("")
-        return title + base + "\n".join(lines)
+                    then(f"| {i} | {item['value']} | {item['count']} |")
+                then()
+        return buf.getvalue()
 
-    if analysis["type"] == "json_object":
-        lines = ["## JSON Object Keys\n"]
+    if kind == "json_object":
+        line("## JSON Object Keys\n")
         for k, v in analysis["keys"].items():
-            line = f"- `{k}` → **{v['type']}**"
+            w(f"- `{k}` → **{v['type']}**")
             if "length" in v:
-                line += f" (length: {v['length']})"
+                w(f" (length: {v['length']})")
             if "keys" in v:
-                line += f" (keys: {', '.join(v['keys'])})"
+                w(f" (keys: {', '.join(v['keys'])})")
             if "sample" in v:
-                line += f" (sample: {v['sample']})"
-            lines.append(line)
-        return title + base + "\n".join(lines) + "\n"
+                w(f" (sample: {v['sample']})")
+            line()
+        return buf.getvalue()
 
-    if analysis["type"] == "json_list":
-        lines = [
-            "## JSON List\n",
-            f"- Length: **{analysis['length']}**",
-            f"- Element types (sample): `{', '.join(analysis['element_types_sample'])}`",
-            f"- Sample (up to 10): `{analysis['sample']}`",
-        ]
-        return title + base + "\n".join(lines) + "\n"
+    if kind == "json_list":
+        line("## JSON List\n")
+        line(f"- Length: **{analysis['length']}**")
+        line(f"- Element types (sample): `{', '.join(analysis['element_types_sample'])}`")
+        line(f"- Sample (up to 10): `{analysis['sample']}`")
+        return buf.getvalue()
 
-    return title + base + "_No markdown formatter for this type yet._\n"
+    line("_No markdown formatter for this type yet._")
+    return buf.getvalue()
 
 # ---------- MAIN ----------
 def analyze_file(path: Path, top_n: int, stopwords: bool):
     ext = path.suffix.lower()
     if ext in {".txt", ".log", ".md"}:
+        if path.stat().st_size > LARGE_TEXT_BYTES:
+            return analyze_text_file(path, top_n=top_n, use_stopwords=stopwords)
         content = read_text(path)
         return analyze_text(content, top_n=top_n, use_stopwords=stopwords)
     elif ext == ".csv":
@@ -341,15 +557,92 @@ def analyze_file(path: Path, top_n: int, stopwords: bool):
     else:
         raise ValueError(f"Unsupported file type: {ext}")
 
+def process_file(job):
+    # runs in a worker process, so it takes one picklable tuple and returns the outcome
+    file, name, top_n, stopwords, fmt, outdir = job
+    try:
+        analysis = analyze_file(file, top_n=top_n, stopwords=stopwords)
+        if fmt == "md":
+            report = to_markdown(file, analysis, top_n=top_n)
+            out_path = outdir / f"report_{name}.md"
+            out_path.write_text(report, encoding="utf-8")
+        elif fmt in ("jsonl", "parquet"):
+            # main() collects every record into one shared reports.jsonl / reports.parquet
+            return file, True, {"file": str(file.resolve()), "analysis": analysis}
+        else:
+            out_path = outdir / f"report_{name}.json"
+            out_path.write_bytes(json_dumps({
+                "file": str(file.resolve()),
+                "analysis": analysis
+            }))
+        return file, True, out_path
+    except Exception as e:
+        return file, False, str(e)
+
+def parquet_table(records):
+    # one row per file: file, type and each top-level scalar of the analysis as a typed
+    # (nullable) column; the nested parts differ per type and per file (top_words,
+    # columns_detail, keys, mixed-type samples), so they are kept as one JSON column
+    scalar_keys = {}
+    rows = []
+    for rec in records:
+        scalars, nested = {}, {}
+        for k, v in rec["analysis"].items():
+            if k == "type":
+                continue
+            if isinstance(v, (int, float, str, bool)):
+                scalars[k] = v
+                scalar_keys.setdefault(k, None)
+            else:
+                nested[k] = v
+        rows.append((rec["file"], rec["analysis"]["type"], scalars, nested))
+
+    data = {
+        "file": [r[0] for r in rows],
+        "type": [r[1] for r in rows],
+    }
+    for k in scalar_keys:
+        data[k] = [r[2].get(k) for r in rows]
+    data["details"] = [json_dumps(r[3], indent=False).decode("utf-8") for r in rows]
+    return pa.table(data)
+
+def report_names(files):
+    # report_<stem> unless two inputs share a stem (a.csv + a.json, or the same name
+    # in two folders); then add the extension, and a counter if that still clashes,
+    # so parallel workers never write to the same report file
+    stem_counts = Counter(f.stem for f in files)
+    names = []
+    used = set()
+    for f in files:
+        name = f.stem
+        if stem_counts[name] > 1:
+            name = f"{name}_{f.suffix.lstrip('.').lower()}"
+        candidate, n = name, 1
+        while candidate in used:
+            n += 1
+            candidate = f"{name}_{n}"
+        used.add(candidate)
+        names.append(candidate)
+    return names
+
+def print_result(file, ok, payload):
+    if ok:
+        print(f"[OK] {file.name} → {payload}")
+    else:
+        print(f"[ERR] {file} → {payload}")
+
 def main():
     parser = argparse.ArgumentParser(description="File Reader & Analyzer (Text/CSV/JSON)")
     parser.add_argument("inputs", nargs="+", help="Files or folders to analyze")
     parser.add_argument("-r","--recursive", action="store_true", help="Recurse into subfolders")
     parser.add_argument("--top", type=int, default=10, help="Top N words (text)")
-    parser.add_argument("--format", choices=["md","json"], default="md", help="Report format")
+    parser.add_argument("--format", choices=["md","json","jsonl","parquet"], default="md",
+                        help="Report format (jsonl/parquet: one reports.jsonl/reports.parquet for all files)")
     parser.add_argument("-o","--out", default="reports", help="Output directory for reports")
     parser.add_argument("--stopwords", action="store_true", help="Ignore common words in text analysis")
     args = parser.parse_args()
+    if args.format == "parquet" and pa is None:
+        parser.error("--format parquet needs pyarrow (pip install pyarrow); use --format jsonl without it")
 
     outdir = Path(args.out)
     outdir.mkdir(parents=True, exist_ok=True)
@@ -359,24 +652,40 @@ def main():
         print("No supported files found.")
         return
 
-    for file in files:
-        try:
-            analysis = analyze_file(file, top_n=args.top, stopwords=args.stopwords)
-            if args.format == "md":
-                report = to_markdown(file, analysis, top_n=args.top)
-                out_path = outdir / f"report_{file.stem}.md"
-                out_path.write_text(report, encoding="utf-8")
-                print(f"[OK] {file.name} → {out_path}")
-            else:
-                out_path = outdir / f"report_{file.stem}.json"
-                with out_path.open("w", encoding="utf-8") as f:
-                    json.dump({
-                        "file": str(file.resolve()),
-                        "analysis": analysis
-                    }, f, ensure_ascii=False, indent=2)
-                print(f"[OK] {file.name} → {out_path}")
-        except Exception as e:
-            print(f"[ERR] {file} → {e}")
+    jobs = [
+        (f, name, args.top, args.stopwords, args.format, outdir)
+        for f, name in zip(files, report_names(files))
+    ]
+    with ExitStack() as stack:
+        if len(files) < 4:
+            # not worth starting worker processes for a handful of files
+            results = map(process_file, jobs)
+        else:
+            workers = os.cpu_count() or 1
+            chunksize = max(1, len(jobs) // (workers * 4))
+            pool = stack.enter_context(ProcessPoolExecutor(max_workers=workers))
+            results = pool.map(process_file, jobs, chunksize=chunksize)
+
+        jsonl = None
+        if args.format == "jsonl":
+            jsonl_path = outdir / "reports.jsonl"
+            jsonl = stack.enter_context(jsonl_path.open("wb"))
+
+        if args.format == "parquet":
+            # a Parquet file is written in one go, so report once it is on disk
+            results = list(results)
+            parquet_path = outdir / "reports.parquet"
+            records = [payload for _, ok, payload in results if ok]
+            pq.write_table(parquet_table(records), parquet_path, compression="zstd")
+            for file, ok, payload in results:
+                print_result(file, ok, parquet_path if ok else payload)
+            return
+
+        for file, ok, payload in results:
+            if ok and jsonl is not None:
+                jsonl.write(json_dumps(payload, indent=False) + b"\n")
+                payload = jsonl_path
+            print_result(file, ok, payload)
 
 if __name__ == "__main__":
     main()
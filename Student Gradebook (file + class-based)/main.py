@@ -1,6 +1,39 @@
 import json
+import re
+from bisect import bisect_right
 from pathlib import Path
 
+try:
+    import orjson  # optional, faster JSON parsing/serialisation
+except ImportError:
+    orjson = None
+
+# grade boundaries: below 60 is F, 60-69 D, 70-79 C, 80-89 B, 90+ A
+GRADE_CUTOFFS = [60, 70, 80, 90]
+GRADES = "FDCBA"
+
+
+def grade_for(avg):
+    # written as "not >=" so a NaN average (e.g. from a NaN mark) fails like the old elif chain did
+    if not avg >= GRADE_CUTOFFS[0]:
+        return "F"
+    return GRADES[bisect_right(GRADE_CUTOFFS, avg)]
+
+
+# orjson turns integers outside the 64-bit range into floats instead of failing,
+# so input with any run of 19+ digits is parsed by json, which keeps them exact
+LONG_DIGITS_RE = re.compile(rb"\d{19,}")
+
+
+def load_json(raw):
+    if orjson is not None and not LONG_DIGITS_RE.search(raw):
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(raw)
+
+
 # ---------- Student Class ----------
 class Student:
     def __init__(self, roll_no, name):
@@ -17,12 +50,7 @@ class Student:
         return sum(self.marks.values()) / len(self.marks)
 
     def get_grade(self):
-        avg = self.get_average()
-        if avg >= 90: return "A"
-        elif avg >= 80: return "B"
-        elif avg >= 70: return "C"
-        elif avg >= 60: return "D"
-        else: return "F"
+        return grade_for(self.get_average())
 
     def to_dict(self):
         return {"name": self.name, "marks": self.marks}
@@ -67,13 +95,31 @@ class Gradebook:
         print(f"Grade: {s.get_grade()}")
         print("-" * 40)
 
+    def print_class_report(self):
+        print(f"\nClass Report ({len(self.students)} students)")
+        print("-" * 40)
+        for roll_no, s in self.students.items():
+            avg = s.get_average()
+            print(f"{roll_no:6} {s.name:15} {avg:6.2f}  {grade_for(avg)}")
+        print("-" * 40)
+
+    # orjson rejects input that json accepts (int roll numbers as keys, NaN
+    # literals), so those cases fall back to json; when orjson does write the file
+    # its float formatting can differ slightly and NaN marks are saved as null
     def save(self):
         data = {r: s.to_dict() for r, s in self.students.items()}
+        if orjson is not None:
+            try:
+                self.filepath.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+                return
+            except orjson.JSONEncodeError:
+                pass
         self.filepath.write_text(json.dumps(data, indent=2))
 
     def load(self):
         if self.filepath.exists():
-            data = json.loads(self.filepath.read_text())
+            raw = self.filepath.read_bytes()
+            data = load_json(raw)
             self.students = {r: Student.from_dict(r, s) for r, s in data.items()}
         else:
             self.students = {}
@@ -98,6 +144,7 @@ if __name__ == "__main__":
     gb.print_report("102")
     gb.print_report("103")
     gb.print_report("104")
+    gb.print_class_report()
 
 
     # Save to file
@@ -4,6 +4,11 @@ import sqlite3
 conn = sqlite3.connect("todo.db")
 cursor = conn.cursor()
 
+# WAL journal with NORMAL sync: commits no longer fsync the main database file each time
+conn.execute("PRAGMA journal_mode=WAL")
+conn.execute("PRAGMA synchronous=NORMAL")
+conn.execute("PRAGMA temp_store=MEMORY")
+
 # Create table
 cursor.execute("""
 CREATE TABLE IF NOT EXISTS tasks (
@@ -21,6 +26,12 @@ def add_task(task):
     conn.commit()
     print("✅ Task added!")
 
+# Add several tasks in one transaction
+def add_tasks_bulk(tasks):
+    cursor.executemany("INSERT INTO tasks (task) VALUES (?)", [(t,) for t in tasks])
+    conn.commit()
+    print(f"✅ {len(tasks)} task(s) added!")
+
 # View Tasks
 def view_tasks():
     cursor.execute("SELECT * FROM tasks")
@@ -47,10 +58,11 @@ def menu():
     while True:
         print("\n📋 To-Do List Menu:")
         print("1. Add Task")
-        print("2. View Tasks")
-        print("3. Mark Task Complete")
-        print("4. Delete Task")
-        print("5. Exit")
+        print("2. Add Multiple Tasks")
+        print("3. View Tasks")
+        print("4. Mark Task Complete")
+        print("5. Delete Task")
+        print("6. Exit")
 
         choice = input("Enter choice: ")
 
@@ -58,14 +70,24 @@ def menu():
             task = input("Enter task: ")
             add_task(task)
         elif choice == "2":
-            view_tasks()
+            print("Enter one task per line (blank line to finish):")
+            tasks = []
+            while True:
+                task = input("> ")
+                if not task:
+                    break
+                tasks.append(task)
+            if tasks:
+                add_tasks_bulk(tasks)
         elif choice == "3":
+            view_tasks()
+        elif choice == "4":
             task_id = int(input("Enter task ID to complete: "))
             mark_complete(task_id)
-        elif choice == "4":
+        elif choice == "5":
             task_id = int(input("Enter task ID to delete: "))
             delete_task(task_id)
-        elif choice == "5":
+        elif choice == "6":
             print("👋 Goodbye!")
             break
         else: